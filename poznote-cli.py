@@ -19,6 +19,8 @@ CONFIGURATION:
     POZNOTE_USER_ID="your_id"
     POZNOTE_WORKSPACE="Clip"
     POZNOTE_ADVANCED_FEATURES="true" (Enables -L, -s, -U, and -D)
+    POZNOTE_CACHE_TTL="5" (Optional: seconds to reuse cached GET responses, 0 disables)
+    POZNOTE_BULK_DELETE_ENDPOINT="/api/v1/..." (Optional: POST {"ids": [...]} for multi-ID -D)
 
 NOTE ON SEARCH (-s):
 The Poznote API currently returns a list of IDs for results. While the browser 
@@ -29,7 +31,7 @@ CORE ACTIONS:
 - POST:   Capture stdin (or clipboard via -c) and save as a new note.
 - READ:   Retrieve the most recent note (-L) or search by keyword (-s).
 - UPDATE: Edit existing notes by ID (-U) using new piped input.
-- DELETE: Remove notes by ID (-D).
+- DELETE: Remove notes by ID (-D), several at once with -D 12,15,19.
 - BURN:   Post a note and interactively delete it after a keypress (-b).
 """
 
@@ -37,44 +39,136 @@ import sys
 import os
 import subprocess
 import shutil
-import argparse
 import time
 import json
+import hashlib
+import threading
+from functools import lru_cache
+from collections import namedtuple
+from pathlib import Path
 
-# 1. Dependency Guard: Ensure required non-standard libraries are installed
+# Optional Speedup: Use orjson for parsing/serializing when installed, stdlib json otherwise
 try:
-    import requests
-    from requests.auth import HTTPBasicAuth
-    from dotenv import load_dotenv
-    from pathlib import Path
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = lambda obj: orjson.dumps(obj).decode()
+    json_dumps_bytes = orjson.dumps
 except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+    json_dumps_bytes = lambda obj: json.dumps(obj, separators=(",", ":")).encode()
+
+# 1. Dependency Guard: Non-standard libraries are imported lazily where first needed,
+# so help and early-exit paths skip their import cost. This reports a failed import.
+def missing_dependencies():
     print("Error: Missing dependencies.")
-    print("Please run: sudo apt install python3-requests python3-dotenv")
+    print("Please run: sudo apt install python3-requests")
     sys.exit(10)
 
 # 2. Clipboard Integration: Supports Copying (for URLs) and Pasting (for -c flag)
+# Tool paths and the script name are fixed for the process, so resolve them once at load.
+XCLIP = shutil.which("xclip")
+WL_COPY = shutil.which("wl-copy")
+WL_PASTE = shutil.which("wl-paste")
+SCRIPT_NAME = os.path.basename(__file__)
+
 def copy_to_clipboard(text):
-    if shutil.which("xclip"):
-        subprocess.Popen(['xclip', '-selection', 'clipboard'], stdin=subprocess.PIPE).communicate(input=text.encode())
-    elif shutil.which("wl-copy"):
-        subprocess.Popen(['wl-copy'], stdin=subprocess.PIPE).communicate(input=text.encode())
+    if XCLIP:
+        cmd = [XCLIP, '-selection', 'clipboard']
+    elif WL_COPY:
+        cmd = [WL_COPY]
+    else:
+        return
+    subprocess.run(cmd, input=text.encode(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
 
 def get_clipboard_text():
     """Reads text from the system clipboard using xclip or wl-paste."""
+    if XCLIP:
+        cmd = [XCLIP, '-selection', 'clipboard', '-o']
+    elif WL_PASTE:
+        cmd = [WL_PASTE]
+    else:
+        return None
     try:
-        if shutil.which("xclip"):
-            return subprocess.check_output(['xclip', '-selection', 'clipboard', '-o']).decode().strip()
-        elif shutil.which("wl-paste"):
-            return subprocess.check_output(['wl-paste']).decode().strip()
+        return subprocess.check_output(cmd).decode().strip()
     except Exception:
         return None
-    return None
+
+# 2b. Stdin Reader: Reads piped input as raw bytes and decodes it once
+def read_stdin():
+    raw = sys.stdin.buffer.read()
+    text = raw.decode(sys.stdin.encoding or "utf-8", errors="replace")
+    del raw  # Drop the bytes before strip() may copy the text
+    return text.strip()
+
+def require_piped_input(message):
+    if sys.stdin.isatty():
+        print(message)
+        sys.exit(11)
+
+def argv_uses_flag(short_flags, long_flags):
+    """Cheap pre-parse scan of sys.argv (handles -bc bundles and --long prefixes)."""
+    for arg in sys.argv[1:]:
+        if arg == "--":
+            break
+        if arg.startswith("--"):
+            name = arg.split("=", 1)[0]
+            if any(flag.startswith(name) for flag in long_flags):
+                return True
+        elif arg.startswith("-") and set(arg[1:]) & set(short_flags):
+            return True
+    return False
+
+# 2c. Keypress Reader: Returns on a single key from /dev/tty (cbreak mode), or Enter as fallback
+def wait_for_keypress(action):
+    try:
+        import termios
+        import tty
+        fd = os.open('/dev/tty', os.O_RDONLY)
+    except (ImportError, OSError):
+        input(f"Press [Enter] to {action}...")
+        return
+    try:
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            print(f"Press any key to {action}...", end="", flush=True)
+            os.read(fd, 1)
+        finally:
+            # Discard the rest of multi-byte keys (e.g. arrows send ESC [ A) so they don't reach the shell
+            termios.tcflush(fd, termios.TCIFLUSH)
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+        print()
+    except termios.error:
+        input(f"Press [Enter] to {action}...")
+    finally:
+        os.close(fd)
 
 # 3. Config Manager: Reads the ~/.poznote.conf file and extracts credentials/feature toggles
+def load_config_file(config_path):
+    """Parses KEY="VALUE" lines into os.environ without overriding existing variables."""
+    for line in config_path.read_text().splitlines():
+        line = line.strip()
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if value[:1] in ('"', "'") and value.find(value[0], 1) != -1:
+            value = value[1:value.find(value[0], 1)]
+        else:
+            value = value.split(" #", 1)[0].strip()
+        os.environ.setdefault(key.strip(), value)
+
+Config = namedtuple("Config", "base_url user password user_id workspace adv_feat cache_ttl bulk_delete_endpoint")
+
+# Cached so the config file is parsed once per process, not on every request.
+@lru_cache(maxsize=1)
 def get_config():
     config_path = Path("~/.poznote.conf").expanduser()
     if config_path.exists():
-        load_dotenv(dotenv_path=config_path)
+        load_config_file(config_path)
     
     url = os.getenv('POZNOTE_URL')
     user = os.getenv('POZNOTE_USER')
@@ -82,46 +176,193 @@ def get_config():
     user_id = os.getenv('POZNOTE_USER_ID', '1')
     workspace = os.getenv('POZNOTE_WORKSPACE', 'Poznote')
     adv_feat = os.getenv('POZNOTE_ADVANCED_FEATURES', 'false').lower() == 'true'
+    bulk_delete_endpoint = os.getenv('POZNOTE_BULK_DELETE_ENDPOINT') or None
+    try:
+        cache_ttl = float(os.getenv('POZNOTE_CACHE_TTL', '5'))
+    except ValueError:
+        cache_ttl = 0.0  # An invalid TTL disables the cache rather than failing
     
     if not all([url, user, password]):
         print(f"Error: Credentials missing in {config_path}")
         sys.exit(12)
-    return url.rstrip('/'), user, password, user_id, workspace, adv_feat
+    return Config(url.rstrip('/'), user, password, user_id, workspace, adv_feat, cache_ttl, bulk_delete_endpoint)
 
 # 4. Debug Curl Helper: Prints the equivalent curl command
 def print_debug_curl(method, url, headers, auth, payload=None):
-    auth_str = f"{auth.username}:{auth.password}"
-    cmd = [f"curl -X {method} '{url}'", f"-u '{auth_str}'"]
-    for k, v in headers.items():
-        cmd.append(f"-H '{k}: {v}'")
-    if payload:
-        cmd.append(f"-d '{json.dumps(payload)}'")
-    print("\n--- DEBUG: CURL COMMAND ---")
-    print(" ".join(cmd))
-    print("---------------------------\n")
-
-# 5. Helper for API Requests: Standardizes headers and authentication
-def poznote_request(method, endpoint, payload=None, params=None, debug=False):
-    base_url, user, password, user_id, _, _ = get_config()
-    url = f"{base_url}{endpoint}"
-    headers = {"X-User-ID": str(user_id), "Content-Type": "application/json"}
-    auth = HTTPBasicAuth(user, password)
+    header_str = " ".join(f"-H '{k}: {v}'" for k, v in headers.items())
+    payload_str = f" -d '{json_dumps(payload)}'" if payload else ""
+    print(
+        "\n--- DEBUG: CURL COMMAND ---\n"
+        f"curl -X {method} '{url}' -u '{auth.username}:{auth.password}' {header_str}{payload_str}\n"
+        "---------------------------\n"
+    )
+
+# 4b. Response Cache: Short-TTL on-disk cache for GET responses (POZNOTE_CACHE_TTL seconds)
+# Entries hold note bodies, so the directory and files are private to the user.
+CACHE_DIR = Path("~/.cache/poznote").expanduser()
+CACHE_MAX_AGE = 24 * 3600  # Entries kept for revalidation are pruned after a day
+
+def cache_key(cfg, url, params):
+    return hashlib.sha1(f"{cfg.user_id}|{url}|{sorted((params or {}).items())}".encode()).hexdigest()
+
+def cache_get(key, ttl=None):
+    """Returns the cached body, or None if missing or older than ttl (None skips the age check)."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if ttl is None or time.time() - os.path.getmtime(path) <= ttl:
+            return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def cache_validators(key):
+    """Returns conditional request headers built from the stored ETag/Last-Modified."""
+    try:
+        meta = json_loads((CACHE_DIR / f"{key}.meta.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+def cache_write(path, data):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(fd, 0o600)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def cache_prune():
+    cutoff = time.time() - CACHE_MAX_AGE
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            if os.path.getmtime(path) < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+def cache_put(key, body, response_headers=None):
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        CACHE_DIR.chmod(0o700)
+        cache_write(CACHE_DIR / f"{key}.json", json_dumps_bytes(body))
+        if response_headers is not None:
+            meta = {"etag": response_headers.get("ETag"), "last_modified": response_headers.get("Last-Modified")}
+            cache_write(CACHE_DIR / f"{key}.meta.json", json_dumps_bytes(meta))
+    except OSError:
+        pass
+    cache_prune()
+
+def cache_touch(key):
+    try:
+        (CACHE_DIR / f"{key}.json").touch()
+    except OSError:
+        pass
+
+def cache_clear():
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+# 5. HTTP Session: One pooled keep-alive session so sequential calls skip the TLS handshake
+@lru_cache(maxsize=1)
+def get_session(cfg):
+    try:
+        import requests
+        from requests.auth import HTTPBasicAuth
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        missing_dependencies()
+
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.auth = HTTPBasicAuth(cfg.user, cfg.password)
+    session.headers.update({"X-User-ID": str(cfg.user_id), "Content-Type": "application/json", "Connection": "keep-alive"})
+    return session
+
+# 5b. Helper for API Requests: Standardizes headers and authentication
+def poznote_request(cfg, method, endpoint, payload=None, params=None, debug=False):
+    url = f"{cfg.base_url}{endpoint}"
     
     if debug:
-        print_debug_curl(method, url, headers, auth, payload)
-
+        session = get_session(cfg)
+        headers = {k: v for k, v in session.headers.items() if k in ("X-User-ID", "Content-Type")}
+        print_debug_curl(method, url, headers, session.auth, payload)
+
+    key = None
+    headers = {}
+    if method != "GET":
+        cache_clear()
+    elif cfg.cache_ttl > 0:
+        key = cache_key(cfg, url, params)
+        cached = cache_get(key, cfg.cache_ttl)
+        if cached is not None:
+            return cached
+        # Stale entry: revalidate so an unchanged resource comes back as a bodiless 304
+        headers = cache_validators(key)
+
+    # Only a real network round-trip pays for importing requests and building the session
+    session = get_session(cfg)
+    from requests.exceptions import RequestException
     try:
-        response = requests.request(method, url, json=payload, params=params, headers=headers, auth=auth, timeout=10)
+        # Encode once ourselves; Content-Type is already set on the session
+        data = json_dumps_bytes(payload) if payload is not None else None
+        response = session.request(method, url, data=data, params=params, headers=headers, timeout=10)
+        if key and response.status_code == 304:
+            cached = cache_get(key)
+            if cached is not None:
+                cache_touch(key)
+                return cached
+            # Validators outlived their body: fetch unconditionally
+            response = session.request(method, url, params=params, timeout=10)
         response.raise_for_status()
-        return response.json() if response.content else {"success": True}
-    except requests.exceptions.RequestException as e:
+        # Callers of update/delete only need success, so leave the body unparsed
+        if method in ("DELETE", "PATCH"):
+            response.close()
+            return {"success": True}
+        body = json_loads(response.content) if response.content else {"success": True}
+        if key:
+            cache_put(key, body, response.headers)
+        return body
+    except (RequestException, ValueError) as e:
         print(f"Error: API Request failed: {e}")
         sys.exit(13)
 
-# 6. Read Action: Fetches the ID then does a deep fetch for content
-def list_last_note(debug=False):
-    base_url, _, _, _, workspace, _ = get_config()
-    data = poznote_request("GET", "/api/v1/notes", params={"workspace": workspace}, debug=debug)
+# 5c. Keep-Alive Heartbeat: Pings the server while idle so the next request reuses a live socket.
+# Bounded to max_pings (~1 minute) so an abandoned prompt doesn't keep hitting the server.
+def keep_connection_warm(cfg, endpoint, stop, interval=4, max_pings=15):
+    session = get_session(cfg)
+    from requests.exceptions import RequestException
+    for _ in range(max_pings):
+        if stop.wait(interval):
+            return
+        try:
+            session.head(f"{cfg.base_url}{endpoint}", timeout=5).close()
+        except RequestException:
+            pass
+
+# 6. Note Resolver: Uses content inlined in a list entry, deep fetches only when missing
+def resolve_note(cfg, entry, debug=False):
+    if "heading" in entry and "content" in entry:
+        return entry
+    detail_data = poznote_request(cfg, "GET", f"/api/v1/notes/{entry.get('id')}", debug=debug)
+    return detail_data.get("note", {})
+
+# 6a. Read Action: Fetches the most recent note (single request when the server inlines content)
+def list_last_note(cfg, debug=False):
+    base_url, workspace = cfg.base_url, cfg.workspace
+    params = {"workspace": workspace, "limit": 1, "full": "1"}
+    data = poznote_request(cfg, "GET", "/api/v1/notes", params=params, debug=debug)
     notes = data.get("notes", [])
     
     if not notes:
@@ -129,8 +370,7 @@ def list_last_note(debug=False):
         return
 
     last_id = notes[0].get("id")
-    detail_data = poznote_request("GET", f"/api/v1/notes/{last_id}", debug=debug)
-    note = detail_data.get("note", {})
+    note = resolve_note(cfg, notes[0], debug=debug)
     
     print(f"--- Latest Note in {workspace} [ID: {last_id}] ---")
     print(f"{note.get('heading', 'No Title')}")
@@ -141,10 +381,11 @@ def list_last_note(debug=False):
     print(f"URL: {full_url}")
     copy_to_clipboard(full_url)
 
-# 6b. Search Action: Finds ID via search, then deep fetches content for the first hit
-def search_notes(query, debug=False):
-    base_url, _, _, _, workspace, _ = get_config()
-    data = poznote_request("GET", "/api/v1/notes", params={"workspace": workspace, "search": query}, debug=debug)
+# 6b. Search Action: Finds the first hit via search, deep fetching content only if not inlined
+def search_notes(cfg, query, debug=False):
+    base_url, workspace = cfg.base_url, cfg.workspace
+    params = {"workspace": workspace, "search": query, "limit": 1, "full": "1"}
+    data = poznote_request(cfg, "GET", "/api/v1/notes", params=params, debug=debug)
     notes = data.get("notes", [])
     
     if not notes:
@@ -152,8 +393,7 @@ def search_notes(query, debug=False):
         return
 
     first_id = notes[0].get("id")
-    detail_data = poznote_request("GET", f"/api/v1/notes/{first_id}", debug=debug)
-    note = detail_data.get("note", {})
+    note = resolve_note(cfg, notes[0], debug=debug)
     
     print(f"First match for '{query}' in {workspace} [ID: {first_id}]")
     print(f"{note.get('heading', 'No Title')}")
@@ -165,35 +405,43 @@ def search_notes(query, debug=False):
     copy_to_clipboard(full_url)
 
 # 7. Delete Action: Permanently removes a note by its numeric ID
-def delete_note(note_id, silent=False, debug=False):
-    poznote_request("DELETE", f"/api/v1/notes/{note_id}", debug=debug)
+def delete_note(cfg, note_id, silent=False, debug=False):
+    poznote_request(cfg, "DELETE", f"/api/v1/notes/{note_id}", debug=debug)
     if not silent:
         print(f"Success: Note {note_id} deleted.")
 
+# 7b. Batch Delete: Removes several notes in one invocation (-D 12,15,19)
+def delete_notes(cfg, note_ids, debug=False):
+    if len(note_ids) == 1:
+        delete_note(cfg, note_ids[0], debug=debug)
+    elif cfg.bulk_delete_endpoint:
+        poznote_request(cfg, "POST", cfg.bulk_delete_endpoint, payload={"ids": note_ids}, debug=debug)
+        print(f"Success: Notes {', '.join(note_ids)} deleted.")
+    else:
+        # Fan out on the shared session; its pool holds up to 4 keep-alive connections.
+        # Build it up front so the workers don't race to create their own.
+        from concurrent.futures import ThreadPoolExecutor
+        get_session(cfg)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda note_id: delete_note(cfg, note_id, debug=debug), note_ids))
+
 # 8. Update Action: Replaces note content using a PATCH request and piped input
-def update_note(note_id, debug=False):
-    if sys.stdin.isatty():
-        print("Error: No piped input detected for update.")
-        sys.exit(11)
-    
-    input_data = sys.stdin.read().strip()
+def update_note(cfg, note_id, debug=False):
+    input_data = read_stdin()
     if not input_data: return
 
     payload = {"content": input_data}
-    poznote_request("PATCH", f"/api/v1/notes/{note_id}", payload=payload, debug=debug)
+    poznote_request(cfg, "PATCH", f"/api/v1/notes/{note_id}", payload=payload, debug=debug)
     print(f"Success: Note {note_id} updated via PATCH.")
 
 # 9. Post Action: Creates a new note from piped data or clipboard (-c)
-def post_to_poznote(tags=None, from_clipboard=False, show_delete=False, show_update=False, burn=False, debug=False):
-    base_url, _, _, _, workspace, _ = get_config()
+def post_to_poznote(cfg, tags=None, from_clipboard=False, show_delete=False, show_update=False, burn=False, debug=False):
+    base_url, workspace = cfg.base_url, cfg.workspace
 
     if from_clipboard:
         input_data = get_clipboard_text()
     else:
-        if sys.stdin.isatty():
-            print("Error: No piped input. Use -c to post from clipboard.")
-            sys.exit(11)
-        input_data = sys.stdin.read().strip()
+        input_data = read_stdin()
 
     if not input_data: sys.exit(0)
 
@@ -205,39 +453,61 @@ def post_to_poznote(tags=None, from_clipboard=False, show_delete=False, show_upd
     }
     if tags: payload["tags"] = tags.split(',')
 
-    data = poznote_request("POST", "/api/v1/notes", payload=payload, debug=debug)
+    data = poznote_request(cfg, "POST", "/api/v1/notes", payload=payload, debug=debug)
     note_id = data.get("note", {}).get("id")
     
     full_url = f"{base_url}/index.php?workspace={workspace}&note={note_id}"
     print(f"Success: {full_url}")
     copy_to_clipboard(full_url)
 
-    script_name = os.path.basename(__file__)
     if show_delete and note_id:
-        print(f"To delete this note run: {script_name} -D {note_id}")
+        print(f"To delete this note run: {SCRIPT_NAME} -D {note_id}")
     if show_update and note_id:
-        print(f"To update this note run: [command] | {script_name} -U {note_id}")
+        print(f"To update this note run: [command] | {SCRIPT_NAME} -U {note_id}")
 
     if burn and note_id:
         # I am leaving intentionally the emoji of fire because it actually looks cool. 
         # Even thought it might look like vibe code
         print(f"\n🔥 BURN MODE: Note will be deleted from {workspace} when you proceed.")
+        # Servers drop idle keep-alive sockets after a few seconds; stay warm during the keypress wait
+        stop = threading.Event()
+        warmer = threading.Thread(target=keep_connection_warm, args=(cfg, f"/api/v1/notes/{note_id}", stop), daemon=True)
+        warmer.start()
         try:
-            with open('/dev/tty', 'r') as tty:
-                print("Press [Enter] to delete...", end="", flush=True)
-                tty.readline()
-        except Exception:
-            input("Press [Enter] to delete...")
-        delete_note(note_id, silent=False, debug=debug)
+            wait_for_keypress("delete")
+        finally:
+            # No join: a HEAD still in flight must not delay the DELETE; the daemon thread just exits
+            stop.set()
+        delete_note(cfg, note_id, silent=False, debug=debug)
 
 # 10. CLI Entry Point: Parses flags and routes to the correct function
 if __name__ == "__main__":
-    _, _, _, _, workspace, adv_feat = get_config()
+    POST_TTY_ERROR = "Error: No piped input. Use -c to post from clipboard."
+
+    # Fast path: a bare `cmd | poznote-cli.py` uses no flags, so skip building the parser.
+    # The TTY check runs first so a mis-invocation exits before reading the config.
+    if len(sys.argv) == 1:
+        require_piped_input(POST_TTY_ERROR)
+        post_to_poznote(get_config())
+        sys.exit(0)
+
+    # With flags, argparse needs the config (help text depends on it), so pre-scan argv
+    # for the post/update paths that need a pipe and fail on a TTY before reading it.
+    if sys.stdin.isatty() and not argv_uses_flag("LsDh", ("--last", "--search", "--delete", "--help")):
+        if argv_uses_flag("U", ("--update",)):
+            require_piped_input("Error: No piped input detected for update.")
+        elif not argv_uses_flag("c", ("--clipboard",)):
+            require_piped_input(POST_TTY_ERROR)
+
+    cfg = get_config()
+
+    import argparse
+    adv_feat = cfg.adv_feat
 
     # Define help text or suppress based on Advanced Features toggle
     l_help = "List the most recent note" if adv_feat else argparse.SUPPRESS
     s_help = "Search notes by keyword" if adv_feat else argparse.SUPPRESS
-    D_help = "Delete a specific note by ID" if adv_feat else argparse.SUPPRESS
+    D_help = "Delete notes by ID (comma-separated for several)" if adv_feat else argparse.SUPPRESS
     U_help = "Update a specific note by ID" if adv_feat else argparse.SUPPRESS
 
     parser = argparse.ArgumentParser(
@@ -253,7 +523,7 @@ if __name__ == "__main__":
     parser.add_argument("--debug", action="store_true", help="Display equivalent curl command")
     
     # Advanced Features (Hidden/Suppressed if adv_feat is False)
-    parser.add_argument("-D", "--delete", metavar="ID", help=D_help)
+    parser.add_argument("-D", "--delete", metavar="ID[,ID...]", help=D_help)
     parser.add_argument("-U", "--update", metavar="ID", help=U_help)
     parser.add_argument("-L", "--last", action="store_true", help=l_help)
     parser.add_argument("-s", "--search", metavar="QUERY", help=s_help)
@@ -261,20 +531,27 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Guard clause: Prevent execution of advanced features if disabled in config
-    if any([args.last, args.search, args.delete, args.update]) and not adv_feat:
+    if any([args.last, args.search, args.delete is not None, args.update]) and not adv_feat:
         print("Error: Advanced features are disabled in ~/.poznote.conf")
         sys.exit(12)
 
     if args.last:
-        list_last_note(debug=args.debug)
+        list_last_note(cfg, debug=args.debug)
     elif args.search:
-        search_notes(args.search, debug=args.debug)
-    elif args.delete:
-        delete_note(args.delete, debug=args.debug)
+        search_notes(cfg, args.search, debug=args.debug)
+    elif args.delete is not None:
+        note_ids = [i.strip() for i in args.delete.split(',') if i.strip()]
+        if not note_ids:
+            parser.error("-D requires at least one note ID")
+        delete_notes(cfg, note_ids, debug=args.debug)
     elif args.update:
-        update_note(args.update, debug=args.debug)
+        require_piped_input("Error: No piped input detected for update.")
+        update_note(cfg, args.update, debug=args.debug)
     else:
+        if not args.clipboard:
+            require_piped_input(POST_TTY_ERROR)
         post_to_poznote(
+            cfg,
             tags=args.tags, 
             from_clipboard=args.clipboard, 
             show_delete=args.d, 
@@ -290,7 +567,7 @@ if __name__ == "__main__":
 
 # --- EXIT CODE REFERENCE ---
 # 0:  Success
-# 10: Missing Python Libraries (requests/dotenv)
+# 10: Missing Python Libraries (requests)
 # 11: No Piped Input (Standard Input is a TTY)
 # 12: Missing Configuration (POZNOTE_URL, USER, or PASS)
 # 13: API or Network Error (Timeout, 401 Unauthorized, etc.)